@@ -209,15 +209,15 @@ class CirqDevice(QubitDevice, abc.ABC):
 
         self.circuit = cirq.Circuit()
 
-    @property
+    @functools.cached_property
     def observables(self):
         # pylint: disable=missing-function-docstring
-        return set(self._observable_map)
+        return frozenset(self._observable_map)
 
-    @property
+    @functools.cached_property
     def operations(self):
         # pylint: disable=missing-function-docstring
-        return set(self._operation_map)
+        return frozenset(self._operation_map)
 
     @abc.abstractmethod
     def _apply_basis_state(self, basis_state_operation):
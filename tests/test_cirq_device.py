@@ -25,8 +25,28 @@ import numpy as np
 
 from pennylane_cirq.cirq_device import CirqDevice
 
+INV_SQRT2 = 1 / math.sqrt(2)
+
+# unitary matrices shared by the QubitUnitary test cases
+U1_ID = np.array([[1, 0], [0, 1]])
+U1_Z = np.array([[1, 0], [0, -1]])
+U1_H = np.array([[-1, 1], [1, 1]]) * INV_SQRT2
+U2_ID = np.eye(4)
+U2_FLIP = np.array([[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]])
+U2_REAL = np.array([[1, -1, -1, 1], [-1, -1, 1, 1], [-1, 1, -1, 1], [1, 1, 1, 1]]) / 2
+
+_OPERATIONS = frozenset(CirqDevice._operation_map)
+_OBSERVABLES = frozenset(CirqDevice._observable_map)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _unabstract():
+    """Allows the abstract CirqDevice class to be instantiated in this module"""
+
+    with patch.multiple(CirqDevice, __abstractmethods__=set()):
+        yield
+
 
-@patch.multiple(CirqDevice, __abstractmethods__=set())
 class TestCirqDeviceInit:
     """Tests the routines of the CirqDevice class."""
 
@@ -45,10 +65,7 @@ class TestCirqDeviceInit:
 
         dev = CirqDevice(3, 100)
 
-        assert len(dev.qubits) == 3
-        assert dev.qubits[0] == cirq.LineQubit(0)
-        assert dev.qubits[1] == cirq.LineQubit(1)
-        assert dev.qubits[2] == cirq.LineQubit(2)
+        assert tuple(dev.qubits) == (cirq.LineQubit(0), cirq.LineQubit(1), cirq.LineQubit(2))
 
     def test_outer_init_of_qubits_ordered(self):
         """Tests that giving qubits as parameters to CirqDevice works when the qubits are already
@@ -173,43 +190,57 @@ class TestCirqDeviceIntegration:
         assert dev.supports_operation(op) == expected
 
 
-@pytest.fixture(scope="function")
-def cirq_device_1_wire(shots):
+@pytest.fixture(scope="module")
+def cirq_device_1_wire():
     """A mock instance of the abstract Device class"""
 
-    with patch.multiple(CirqDevice, __abstractmethods__=set()):
-        yield CirqDevice(1, shots=None)
+    return CirqDevice(1, shots=None)
 
 
-@pytest.fixture(scope="function")
-def cirq_device_2_wires(shots):
+@pytest.fixture(scope="module")
+def cirq_device_2_wires():
     """A mock instance of the abstract Device class"""
 
-    with patch.multiple(CirqDevice, __abstractmethods__=set()):
-        yield CirqDevice(2, shots=None)
+    return CirqDevice(2, shots=None)
 
 
-@pytest.fixture(scope="function")
-def cirq_device_3_wires(shots):
+@pytest.fixture(scope="module")
+def cirq_device_3_wires():
     """A mock instance of the abstract Device class"""
 
-    with patch.multiple(CirqDevice, __abstractmethods__=set()):
-        yield CirqDevice(3, shots=None)
+    return CirqDevice(3, shots=None)
+
+
+class TestProperties:
+    """Tests that the CirqDevice properties are correctly defined."""
+
+    def test_operations(self, cirq_device_1_wire):
+        """Tests that the supported operations are the keys of the operation map."""
+
+        assert cirq_device_1_wire.operations == _OPERATIONS
+        assert cirq_device_1_wire.operations is cirq_device_1_wire.operations
+
+    def test_observables(self, cirq_device_1_wire):
+        """Tests that the supported observables are the keys of the observable map."""
+
+        assert cirq_device_1_wire.observables == _OBSERVABLES
+        assert cirq_device_1_wire.observables is cirq_device_1_wire.observables
 
 
-@pytest.mark.parametrize("shots", [100])
 class TestOperations:
     """Tests that the CirqDevice correctly handles the requested operations."""
 
-    def test_reset_on_empty_circuit(self, cirq_device_1_wire):
+    def test_reset_on_empty_circuit(self):
         """Tests that reset resets the internal circuit when it is not initialized."""
 
-        assert cirq_device_1_wire.circuit is None
+        dev = CirqDevice(1, shots=None)
 
-        cirq_device_1_wire.reset()
+        assert dev.circuit is None
+
+        dev.reset()
 
         # Check if circuit is an empty cirq.Circuit
-        assert cirq_device_1_wire.circuit == cirq.Circuit()
+        assert dev.circuit == cirq.Circuit()
 
     def test_reset_on_full_circuit(self, cirq_device_1_wire):
         """Tests that reset resets the internal circuit when it is filled."""
@@ -218,12 +249,12 @@ class TestOperations:
         cirq_device_1_wire.apply([qml.PauliX(0)])
 
         # Assert that the queue is filled
-        assert list(cirq_device_1_wire.circuit.all_operations())
+        assert any(True for _ in cirq_device_1_wire.circuit.all_operations())
 
         cirq_device_1_wire.reset()
 
         # Assert that the queue is empty
-        assert not list(cirq_device_1_wire.circuit.all_operations())
+        assert next(iter(cirq_device_1_wire.circuit.all_operations()), None) is None
 
     @pytest.mark.parametrize(
         "gate,expected_cirq_gates",
@@ -296,30 +327,28 @@ class TestOperations:
                 [cirq.rz(1), cirq.ry(-0.2), cirq.rz(1.1)],
             ),
             (
-                qml.QubitUnitary(np.array([[1, 0], [0, 1]]), wires=[0]),
-                [cirq.MatrixGate(np.array([[1, 0], [0, 1]]))],
+                qml.QubitUnitary(U1_ID, wires=[0]),
+                [cirq.MatrixGate(U1_ID)],
             ),
             (
-                qml.QubitUnitary(np.array([[1, 0], [0, -1]]), wires=[0]),
-                [cirq.MatrixGate(np.array([[1, 0], [0, -1]]))],
+                qml.QubitUnitary(U1_Z, wires=[0]),
+                [cirq.MatrixGate(U1_Z)],
             ),
             (
-                qml.QubitUnitary(np.array([[-1, 1], [1, 1]]) / math.sqrt(2), wires=[0]),
-                [cirq.MatrixGate(np.array([[-1, 1], [1, 1]]) / math.sqrt(2))],
+                qml.QubitUnitary(U1_H, wires=[0]),
+                [cirq.MatrixGate(U1_H)],
             ),
             (
-                qml.adjoint(qml.QubitUnitary(np.array([[1, 0], [0, 1]]), wires=[0])),
-                [cirq.MatrixGate(np.array([[1, 0], [0, 1]])) ** -1],
+                qml.adjoint(qml.QubitUnitary(U1_ID, wires=[0])),
+                [cirq.MatrixGate(U1_ID) ** -1],
             ),
             (
-                qml.adjoint(qml.QubitUnitary(np.array([[1, 0], [0, -1]]), wires=[0])),
-                [cirq.MatrixGate(np.array([[1, 0], [0, -1]])) ** -1],
+                qml.adjoint(qml.QubitUnitary(U1_Z, wires=[0])),
+                [cirq.MatrixGate(U1_Z) ** -1],
             ),
             (
-                qml.adjoint(
-                    qml.QubitUnitary(np.array([[-1, 1], [1, 1]]) / math.sqrt(2), wires=[0])
-                ),
-                [cirq.MatrixGate(np.array([[-1, 1], [1, 1]]) / math.sqrt(2)) ** -1],
+                qml.adjoint(qml.QubitUnitary(U1_H, wires=[0])),
+                [cirq.MatrixGate(U1_H) ** -1],
             ),
         ],
     )
@@ -331,11 +360,9 @@ class TestOperations:
         cirq_device_1_wire.apply([gate])
 
         ops = list(cirq_device_1_wire.circuit.all_operations())
+        expected = [g.on(*cirq_device_1_wire.qubits) for g in expected_cirq_gates]
 
-        assert len(ops) == len(expected_cirq_gates)
-
-        for i in range(len(ops)):
-            assert ops[i]._gate == expected_cirq_gates[i]
+        assert ops == expected
 
     @pytest.mark.parametrize(
         "gate,expected_cirq_gates",
@@ -420,77 +447,20 @@ class TestOperations:
                     cirq.ControlledGate(cirq.rz(1.1)),
                 ],
             ),
-            (qml.QubitUnitary(np.eye(4), wires=[0, 1]), [cirq.MatrixGate(np.eye(4))]),
-            (
-                qml.QubitUnitary(
-                    np.array([[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]]),
-                    wires=[0, 1],
-                ),
-                [
-                    cirq.MatrixGate(
-                        np.array([[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]])
-                    )
-                ],
-            ),
-            (
-                qml.QubitUnitary(
-                    np.array([[1, -1, -1, 1], [-1, -1, 1, 1], [-1, 1, -1, 1], [1, 1, 1, 1]]) / 2,
-                    wires=[0, 1],
-                ),
-                [
-                    cirq.MatrixGate(
-                        np.array(
-                            [
-                                [1, -1, -1, 1],
-                                [-1, -1, 1, 1],
-                                [-1, 1, -1, 1],
-                                [1, 1, 1, 1],
-                            ]
-                        )
-                        / 2
-                    )
-                ],
-            ),
+            (qml.QubitUnitary(U2_ID, wires=[0, 1]), [cirq.MatrixGate(U2_ID)]),
+            (qml.QubitUnitary(U2_FLIP, wires=[0, 1]), [cirq.MatrixGate(U2_FLIP)]),
+            (qml.QubitUnitary(U2_REAL, wires=[0, 1]), [cirq.MatrixGate(U2_REAL)]),
             (
-                qml.adjoint(qml.QubitUnitary(np.eye(4), wires=[0, 1])),
-                [cirq.MatrixGate(np.eye(4)) ** -1],
+                qml.adjoint(qml.QubitUnitary(U2_ID, wires=[0, 1])),
+                [cirq.MatrixGate(U2_ID) ** -1],
             ),
             (
-                qml.adjoint(
-                    qml.QubitUnitary(
-                        np.array([[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]]),
-                        wires=[0, 1],
-                    )
-                ),
-                [
-                    cirq.MatrixGate(
-                        np.array([[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]])
-                    )
-                    ** -1
-                ],
+                qml.adjoint(qml.QubitUnitary(U2_FLIP, wires=[0, 1])),
+                [cirq.MatrixGate(U2_FLIP) ** -1],
             ),
             (
-                qml.adjoint(
-                    qml.QubitUnitary(
-                        np.array([[1, -1, -1, 1], [-1, -1, 1, 1], [-1, 1, -1, 1], [1, 1, 1, 1]])
-                        / 2,
-                        wires=[0, 1],
-                    )
-                ),
-                [
-                    cirq.MatrixGate(
-                        np.array(
-                            [
-                                [1, -1, -1, 1],
-                                [-1, -1, 1, 1],
-                                [-1, 1, -1, 1],
-                                [1, 1, 1, 1],
-                            ]
-                        )
-                        / 2
-                    )
-                    ** -1
-                ],
+                qml.adjoint(qml.QubitUnitary(U2_REAL, wires=[0, 1])),
+                [cirq.MatrixGate(U2_REAL) ** -1],
             ),
         ],
     )
@@ -502,21 +472,18 @@ class TestOperations:
         cirq_device_2_wires.apply([gate])
 
         ops = list(cirq_device_2_wires.circuit.all_operations())
-        assert len(ops) == len(expected_cirq_gates)
+        expected = [g.on(*cirq_device_2_wires.qubits) for g in expected_cirq_gates]
 
-        for i in range(len(ops)):
-            assert ops[i].gate == expected_cirq_gates[i]
+        assert ops == expected
 
 
 def test_to_paulistring_sanity_check():
-    with patch.multiple(CirqDevice, __abstractmethods__=set()):
-        device = CirqDevice(2, shots=None)
-        result = device.to_paulistring(qml.PauliX(0) @ qml.PauliZ(1))
-        assert result == cirq.X(cirq.LineQubit(0)) * cirq.Z(cirq.LineQubit(1))
+    device = CirqDevice(2, shots=None)
+    result = device.to_paulistring(qml.PauliX(0) @ qml.PauliZ(1))
+    assert result == cirq.X(cirq.LineQubit(0)) * cirq.Z(cirq.LineQubit(1))
 
 
 def test_to_paulistring_single_gate():
-    with patch.multiple(CirqDevice, __abstractmethods__=set()):
-        device = CirqDevice(2, shots=None)
-        result = device.to_paulistring(qml.PauliX(0))
-        assert result == cirq.X(cirq.LineQubit(0))
+    device = CirqDevice(2, shots=None)
+    result = device.to_paulistring(qml.PauliX(0))
+    assert result == cirq.X(cirq.LineQubit(0))
@@ -16,7 +16,6 @@ Unit tests for the SimulatorDevice
 """
 import pytest
 import math
-from unittest.mock import MagicMock, patch
 import pennylane as qml
 import numpy as np
 from pennylane_cirq import SimulatorDevice